@@ -5,56 +5,223 @@
 计算两个字符串之间的编辑距离并显示具体的编辑操作步骤
 """
 
-
-def levenshtein_with_operations(str1, str2):
+try:
+    # 可选依赖：安装rapidfuzz后由其C++实现直接给出距离和编辑操作
+    from rapidfuzz.distance import Levenshtein
+except ImportError:
+    Levenshtein = None
+
+np = None
+njit = None
+if Levenshtein is None:
+    # 未安装rapidfuzz时才需要自行填充DP矩阵；
+    # 可选依赖：安装numpy和numba后使用JIT编译的内核填充（导入较慢，仅在用得到时导入）
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        pass
+
+
+# 回溯方向，记录每个单元格的值由哪个相邻单元格得到
+_MATCH, _REPLACE, _DELETE, _INSERT = 0, 1, 2, 3
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _fill_dp(eq, parent):
+        """
+        填充DP矩阵的JIT内核，eq[i, j]表示str1[i]与str2[j]是否相同
+        parent为按行展开的一维数组，parent[i * (n + 1) + j]对应矩阵的第i行第j列；
+        DP数值只保留上一行和当前行，返回编辑距离
+        """
+        m, n = eq.shape
+        w = n + 1
+        prev = np.arange(w, dtype=np.int32)
+        curr = np.empty(w, dtype=np.int32)
+
+        # 初始化边界
+        for i in range(m + 1):
+            parent[i * w] = _DELETE
+        for j in range(1, w):
+            parent[j] = _INSERT
+
+        # 填充矩阵，相同代价时按 替换 > 删除 > 插入 的优先级选择
+        for i in range(1, m + 1):
+            row = i * w
+            curr[0] = i
+            for j in range(1, w):
+                diag = prev[j - 1]
+                if eq[i - 1, j - 1]:
+                    curr[j] = diag
+                    parent[row + j] = _MATCH
+                    continue
+                up = prev[j]
+                left = curr[j - 1]
+                if diag <= up and diag <= left:
+                    curr[j] = diag + 1
+                    parent[row + j] = _REPLACE
+                elif up <= left:
+                    curr[j] = up + 1
+                    parent[row + j] = _DELETE
+                else:
+                    curr[j] = left + 1
+                    parent[row + j] = _INSERT
+            prev, curr = curr, prev
+
+        return prev[n]
+else:
+    _fill_dp = None
+
+
+def _lev_with_ops(str1, str2):
+    """
+    填充DP矩阵并回溯出具体的编辑操作
+    编辑操作以(类型, 源位置, 目标位置)表示，与rapidfuzz的Editop一致，位置从0开始
+    """
     m, n = len(str1), len(str2)
-
-    # 构建DP矩阵
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-    # 初始化边界
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
-
-    # 填充矩阵
-    for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            if str1[i - 1] == str2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1]
-            else:
-                dp[i][j] = min(
-                    dp[i - 1][j] + 1,  # 删除
-                    dp[i][j - 1] + 1,  # 插入
-                    dp[i - 1][j - 1] + 1  # 替换
-                )
-
-    # 回溯找到具体操作
+    # 回溯方向按行展开存放在一维数组中，parent[i * w + j]对应第i行第j列，
+    # 每个单元格只占1字节；回溯不再需要DP数值，因此DP只保留两行
+    w = n + 1
+
+    if _fill_dp is not None:
+        # 字符串转为UTF-32码点数组，一次广播比较得到字符相等矩阵，
+        # 编译后的内核只需查表，不再逐个比较字符
+        a = np.frombuffer(str1.encode('utf-32-le'), dtype=np.int32)
+        b = np.frombuffer(str2.encode('utf-32-le'), dtype=np.int32)
+        eq = a[:, None] == b[None, :]
+        parent = np.empty((m + 1) * w, dtype=np.uint8)
+        distance = int(_fill_dp(eq, parent))
+    else:
+        parent = bytearray((m + 1) * w)
+
+        # 初始化边界（第0列在填充每一行时写入）
+        parent[1:w] = bytes([_INSERT]) * n
+        prev = list(range(w))
+
+        # 填充矩阵，相同代价时按 替换 > 删除 > 插入 的优先级选择
+        # 内层用显式比较代替min()，避免每个单元格都构造元组并调用内置函数；
+        # 左方和左上方的值由上一次迭代带入，上方的值与str2的字符一起由zip给出
+        for i in range(1, m + 1):
+            c1 = str1[i - 1]
+            curr = [i]
+            directions = [_DELETE]
+            append = curr.append
+            append_direction = directions.append
+            left = i
+            diag = i - 1
+            for c2, up in zip(str2, prev[1:]):
+                if c1 == c2:
+                    cur = diag
+                    append_direction(_MATCH)
+                elif diag <= up and diag <= left:
+                    cur = diag + 1
+                    append_direction(_REPLACE)
+                elif up <= left:
+                    cur = up + 1
+                    append_direction(_DELETE)
+                else:
+                    cur = left + 1
+                    append_direction(_INSERT)
+                append(cur)
+                left = cur
+                diag = up
+            parent[i * w:(i + 1) * w] = directions
+            prev = curr
+
+        distance = prev[n]
+
+    # 沿回溯方向找到具体操作，无需再比较DP矩阵中的数值
     operations = []
     i, j = m, n
 
     while i > 0 or j > 0:
-        if i > 0 and j > 0 and str1[i - 1] == str2[j - 1]:
+        direction = parent[i * w + j]
+        if direction == _MATCH:
             # 字符相同，无需操作
             i -= 1
             j -= 1
-        elif i > 0 and j > 0 and dp[i][j] == dp[i - 1][j - 1] + 1:
+        elif direction == _REPLACE:
             # 替换操作
-            operations.append(f"替换位置{i}的'{str1[i - 1]}'为'{str2[j - 1]}'")
+            operations.append(('replace', i - 1, j - 1))
             i -= 1
             j -= 1
-        elif i > 0 and dp[i][j] == dp[i - 1][j] + 1:
+        elif direction == _DELETE:
             # 删除操作
-            operations.append(f"删除位置{i}的'{str1[i - 1]}'")
+            operations.append(('delete', i - 1, j))
             i -= 1
-        elif j > 0 and dp[i][j] == dp[i][j - 1] + 1:
+        else:
             # 插入操作
-            operations.append(f"在位置{i + 1}插入'{str2[j - 1]}'")
+            operations.append(('insert', i, j - 1))
             j -= 1
 
     operations.reverse()  # 反转操作序列
-    return dp[m][n], operations
+    return distance, operations
+
+
+def _describe_operations(str1, str2, editops):
+    """
+    将编辑操作转换为中文描述
+    """
+    operations = []
+    for tag, src_pos, dest_pos in editops:
+        if tag == 'replace':
+            operations.append(f"替换位置{src_pos + 1}的'{str1[src_pos]}'为'{str2[dest_pos]}'")
+        elif tag == 'delete':
+            operations.append(f"删除位置{src_pos + 1}的'{str1[src_pos]}'")
+        else:
+            operations.append(f"在位置{src_pos + 1}插入'{str2[dest_pos]}'")
+    return operations
+
+
+def levenshtein_with_operations(str1, str2):
+    # 完全相同的字符串无需任何计算
+    if str1 == str2:
+        return 0, []
+
+    m, n = len(str1), len(str2)
+
+    # 公共前缀和后缀不产生任何编辑操作，先裁掉以缩小DP矩阵
+    prefix = 0
+    limit = min(m, n)
+    while prefix < limit and str1[prefix] == str2[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and str1[m - 1 - suffix] == str2[n - 1 - suffix]:
+        suffix += 1
+
+    mid1 = str1[prefix:m - suffix]
+    mid2 = str2[prefix:n - suffix]
+
+    # 常见的简单情况直接给出操作，无需构建DP矩阵
+    if not mid1:
+        # 只需依次插入
+        editops = [('insert', 0, k) for k in range(len(mid2))]
+    elif not mid2:
+        # 只需依次删除
+        editops = [('delete', k, 0) for k in range(len(mid1))]
+    elif len(mid1) == len(mid2) and mid1[1:-1] == mid2[1:-1]:
+        # 裁剪后首尾字符必然不同，等长且中间部分相同时，
+        # 最多只有两个位置不同，直接替换即为最优
+        last = len(mid1) - 1
+        editops = [('replace', 0, 0)]
+        if last:
+            editops.append(('replace', last, last))
+    elif Levenshtein is not None:
+        editops = Levenshtein.editops(mid1, mid2)
+    else:
+        _, editops = _lev_with_ops(mid1, mid2)
+
+    # 最优操作序列的长度即为编辑距离
+    distance = len(editops)
+
+    # 操作位置是相对裁剪后字符串的，需加上前缀长度
+    if prefix:
+        editops = [(tag, src_pos + prefix, dest_pos + prefix)
+                   for tag, src_pos, dest_pos in editops]
+
+    return distance, _describe_operations(str1, str2, editops)
 
 
 def main():
@@ -129,20 +296,25 @@ if __name__ == "__main__":
 
 1. 初始化阶段
    - 获取用户输入的两个字符串
+   - 两个字符串完全相同时直接返回
+   - 裁掉两个字符串的公共前缀和后缀，只对中间不同的部分计算
+   - 简单情况直接给出操作，无需构建DP矩阵：
+     * 一方差异部分为空：只需插入或删除
+     * 差异部分等长且只有首尾字符不同：只需替换
    - 创建并初始化DP矩阵
 
 2. 矩阵填充阶段
    - 双重循环遍历两个字符串的所有字符
    - 根据字符是否相同，应用相应的状态转移方程
-   - 填充完整的DP矩阵
+   - DP数值只保留上一行和当前行，同时为每个单元格记录回溯方向（1字节）
+   - 代价相同时按优先级选择方向：
+     * 字符相同：来自左上方（无需操作）
+     * 替换操作：左上方值+1为最小值时
+     * 删除操作：上方值+1为最小值时
+     * 插入操作：其余情况，来自左方
 
 3. 回溯操作阶段
-   - 从矩阵右下角开始回溯，找到具体的编辑操作
-   - 按照优先级判断操作类型：
-     * 字符相同：直接移动到左上方
-     * 替换操作：当当前值等于左上方值+1时
-     * 删除操作：当当前值等于上方值+1时
-     * 插入操作：当当前值等于左方值+1时
+   - 从矩阵右下角开始，沿记录的回溯方向移动，找到具体的编辑操作
 
 4. 操作序列构建
    - 将回溯过程中识别的操作按逆序添加到操作列表
@@ -222,7 +394,7 @@ if __name__ == "__main__":
 【算法复杂度】
 
 - 时间复杂度：O(m×n)，其中m和n分别为两个字符串的长度
-- 空间复杂度：O(m×n)，用于存储DP矩阵
+- 空间复杂度：O(m×n)，用于存储每个单元格的回溯方向（每个单元格1字节）
 
 【技术特点】
 
@@ -231,6 +403,8 @@ if __name__ == "__main__":
 - 交互式界面：支持连续测试多个字符串对
 - 灵活退出：提供多种退出方式，提升用户体验
 - 中文支持：完整的中文界面和操作说明
+- 可选加速：未安装rapidfuzz时，若安装了numpy和numba，DP矩阵填充由JIT编译的内核完成（cache=True，编译结果缓存在__pycache__中）
+- 可选加速：安装rapidfuzz后，距离和编辑操作直接由其C++实现计算，不再构建Python的DP矩阵
 
 ================================================================================
 """
\ No newline at end of file
@@ -9,11 +9,90 @@ import os
 import re
 import csv
 import collections
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import argparse
 
 
+# 预编译的正则表达式，避免每次调用都查询re模块的缓存
+# 包含字母的候选词（可能包含数字和其他字符）
+_CAND = re.compile(r'[a-zA-Z][a-zA-Z0-9_$-]*')
+# 一次匹配直接得到驼峰、下划线、中划线、$符号分割后的子词
+# 如 getHTTPResponse -> get, HTTP, Response；XML_parser -> XML, parser
+_TOKEN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+')
+# 删除数字的转换表，用于在C层面判断候选词是否包含数字
+_DIGITS = str.maketrans('', '', '0123456789')
+
+# 要处理的文件扩展名
+# 支持多种编程语言和配置文件
+_TARGET_EXTS = frozenset({
+    # 后端语言
+    '.java', '.py', '.c', '.cpp', '.cs', '.go', '.rs', '.php', '.rb',
+    # 前端语言
+    '.js', '.jsx', '.ts', '.tsx', '.vue',
+    # 标记和样式语言
+    '.html', '.htm', '.css', '.scss', '.sass', '.less',
+    # 配置文件
+    '.xml', '.json', '.yaml', '.yml', '.properties', '.toml', '.ini',
+    # 文档文件
+    '.md', '.txt', '.rst'
+})
+
+# 扫描时跳过的常见忽略目录
+_SKIP_DIRS = frozenset({
+    '.git', '.idea', '.vscode', 'node_modules',
+    'target', 'build', 'dist', '.gradle', '.mvn'
+})
+
+
+def _walk(directory: str) -> Iterator[Tuple[str, str]]:
+    """
+    递归遍历目录，产出(文件路径, 文件名)
+    直接使用os.scandir返回的DirEntry，类型判断通常无需额外的stat调用，
+    路径也无需再用os.path.join拼接；
+    与os.walk自顶向下的顺序一致：先产出当前目录的文件，再依次进入子目录
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        # 与os.walk一致，忽略无法访问的目录
+        return
+
+    files = []
+    subdirs = []
+    with entries:
+        while True:
+            try:
+                entry = next(entries)
+            except StopIteration:
+                break
+            except OSError:
+                # 与os.walk一致，遍历中途出错时跳过整个目录
+                return
+
+            # 类型判断出错时按非目录、非文件处理，不中断整个扫描
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.name not in _SKIP_DIRS:
+                    subdirs.append(entry.path)
+                continue
+
+            try:
+                is_file = entry.is_file()
+            except OSError:
+                is_file = False
+            if is_file:
+                files.append((entry.path, entry.name))
+
+    yield from files
+    for subdir in subdirs:
+        yield from _walk(subdir)
+
+
 class WordExtractor:
     """单词提取器类"""
 
@@ -34,10 +113,18 @@ class WordExtractor:
         3. 分割下划线、中划线、$符号连接的单词
         4. 过滤掉包含数字的内容
         """
-        words = []
-
         # 按行处理，更好地处理代码结构
-        lines = text.split('\n')
+        return list(self.extract_words_from_lines(text.split('\n')))
+
+    def extract_words_from_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        逐行提取单词，处理规则同extract_words_from_text
+        可直接传入文件对象，逐个产出单词，无需把整个文件或单词列表放入内存
+        """
+        # 热点循环中使用的方法提前绑定到局部变量
+        find_candidates = _CAND.findall
+        split_word_variants = self.split_word_variants
+
         for line in lines:
             # 跳过空行
             if not line.strip():
@@ -45,96 +132,54 @@ class WordExtractor:
 
             # 提取包含字母的词汇（可能包含数字和其他字符）
             # 这个正则表达式匹配包含字母的连续字符序列
-            candidate_words = re.findall(r'[a-zA-Z][a-zA-Z0-9_$-]*', line)
+            candidate_words = find_candidates(line)
 
             for candidate in candidate_words:
                 # 过滤掉包含数字的候选词
-                if re.search(r'\d', candidate):
+                if len(candidate.translate(_DIGITS)) != len(candidate):
                     continue
 
                 # 处理驼峰命名、下划线、中划线、$符号
-                split_words = self.split_word_variants(candidate)
+                split_words = split_word_variants(candidate)
 
-                # 过滤掉空字符串和只包含非字母字符的词
+                # 分割结果只由ASCII字母组成且不为空，无需再做校验；
+                # 大小写信息在分割驼峰命名时才需要，分割后再逐个转为小写
                 for word in split_words:
-                    word = word.strip()
-                    if word and re.match(r'^[a-zA-Z]+$', word):
-                        words.append(word.lower())
-
-        return words
+                    yield word.lower()
 
     def split_word_variants(self, word: str) -> List[str]:
         """
         分割各种命名格式的单词
+        $、_、-符号不属于任何子词，匹配时自然成为分隔；
+        驼峰命名按大写字母分割，连续大写字母视为一个词（如XMLParser -> XML Parser）
+        返回的每个子词都不为空，且只由ASCII字母组成
         """
-        result = []
-
-        # 首先按 $、_、- 分割
-        parts = re.split(r'[_$-]+', word)
-
-        for part in parts:
-            if not part:
-                continue
-
-            # 处理驼峰命名
-            # 在小写字母后跟大写字母的地方插入空格
-            camel_split = re.sub(r'([a-z])([A-Z])', r'\1 \2', part)
-
-            # 处理连续大写字母的情况（如XMLParser -> XML Parser）
-            camel_split = re.sub(r'([A-Z])([A-Z][a-z])', r'\1 \2', camel_split)
-
-            # 分割并过滤
-            sub_words = camel_split.split()
-            result.extend(sub_words)
-
-        return result
+        return _TOKEN.findall(word)
 
     def process_file(self, file_path: str) -> bool:
         """
         处理单个文件
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # 提取单词
-            words = self.extract_words_from_text(content)
-
-            # 统计单词
-            for word in words:
-                self.word_count[word] += 1
-                self.total_words += 1
+        word_count = _count_words_in_file(file_path)
+        if word_count is None:
+            return False
 
-            self.files_processed += 1
-            return True
+        self.add_word_count(word_count)
+        return True
 
-        except Exception as e:
-            print(f"处理文件失败 {file_path}: {e}")
-            return False
+    def add_word_count(self, word_count: collections.Counter) -> None:
+        """
+        合并单个文件的单词统计结果
+        """
+        self.word_count.update(word_count)
+        self.total_words += sum(word_count.values())
+        self.files_processed += 1
 
     def should_process_file(self, file_path: str) -> bool:
         """
         判断是否应该处理该文件
         """
-        # 要处理的文件扩展名
-        # 支持多种编程语言和配置文件
-        target_extensions = {
-            # 后端语言
-            '.java', '.py', '.c', '.cpp', '.cs', '.go', '.rs', '.php', '.rb',
-            # 前端语言
-            '.js', '.jsx', '.ts', '.tsx', '.vue',
-            # 标记和样式语言
-            '.html', '.htm', '.css', '.scss', '.sass', '.less',
-            # 配置文件
-            '.xml', '.json', '.yaml', '.yml', '.properties', '.toml', '.ini',
-            # 文档文件
-            '.md', '.txt', '.rst'
-        }
-
-        # 获取文件扩展名
-        _, ext = os.path.splitext(file_path.lower())
-
-        return ext in target_extensions
+        return os.path.splitext(file_path)[1].lower() in _TARGET_EXTS
 
     def scan_directory(self, directory: str) -> None:
         """
@@ -142,20 +187,18 @@ class WordExtractor:
         """
         print(f"开始扫描目录: {directory}")
 
-        # 使用os.walk递归遍历目录
-        for root, dirs, files in os.walk(directory):
-            # 跳过常见的忽略目录
-            dirs[:] = [d for d in dirs if d not in {
-                '.git', '.idea', '.vscode', 'node_modules',
-                'target', 'build', 'dist', '.gradle', '.mvn'
-            }]
+        # 先递归遍历目录，收集所有需要处理的文件
+        file_paths = [file_path for file_path, file_name in _walk(directory)
+                      if self.should_process_file(file_name)]
 
-            for file in files:
-                file_path = os.path.join(root, file)
-
-                if self.should_process_file(file_path):
-                    if self.process_file(file_path):
-                        print(f"已处理: {file_path}")
+        # 文件之间互不依赖，使用多进程并行提取单词，绕过GIL的限制
+        # chunksize让每次进程间通信批量传递多个文件，摊薄通信开销
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_count_words_in_file, file_paths, chunksize=32)
+            for file_path, word_count in zip(file_paths, results):
+                if word_count is not None:
+                    self.add_word_count(word_count)
+                    print(f"已处理: {file_path}")
 
     def export_to_csv(self, output_file: str) -> None:
         """
@@ -173,9 +216,10 @@ class WordExtractor:
             writer.writerow(['单词', '出现次数', '频率(%)'])
 
             # 写入数据
-            for word, count in sorted_words:
-                frequency = (count / self.total_words) * 100 if self.total_words > 0 else 0
-                writer.writerow([word, count, f'{frequency:.4f}'])
+            # 预先计算百分比系数，每行只需一次乘法；writerows在C层面循环写入
+            scale = 100.0 / self.total_words if self.total_words > 0 else 0.0
+            writer.writerows((word, count, f'{count * scale:.4f}')
+                             for word, count in sorted_words)
 
     def print_statistics(self) -> None:
         """
@@ -196,9 +240,33 @@ class WordExtractor:
             print(f"{i:2d}. {word:<15} {count:6d} ({frequency:6.2f}%)")
 
 
+def _count_words_in_file(file_path: str) -> Optional[collections.Counter]:
+    """
+    统计单个文件中的单词，定义在模块级别以便在进程池的工作进程中调用
+
+    Returns:
+        单词计数，读取或处理失败时返回None
+    """
+    try:
+        word_count = collections.Counter()
+
+        # 逐行读取文件，边提取边统计，避免一次性读入整个文件
+        # Counter.update直接消费生成器，计数循环在C层面完成
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            word_count.update(WordExtractor().extract_words_from_lines(f))
+
+        return word_count
+
+    except Exception as e:
+        print(f"处理文件失败 {file_path}: {e}")
+        return None
+
+
 def csv_to_txt(csv_file: str, txt_file: str = None) -> None:
     """
     将CSV文件转换为TXT文件，仅保留第一列的单词
+    输入应为export_to_csv导出的文件：单词列只含ASCII字母，不会出现引号或逗号，
+    因此直接以二进制方式按第一个逗号切分，无需csv模块解析和编解码
 
     Args:
         csv_file: 输入的CSV文件路径
@@ -215,20 +283,19 @@ def csv_to_txt(csv_file: str, txt_file: str = None) -> None:
     try:
         word_count = 0
 
-        with open(csv_file, 'r', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile)
-
+        with open(csv_file, 'rb') as csvfile:
             # 跳过表头
-            header = next(reader)
+            header = next(csvfile).decode('utf-8-sig').rstrip('\r\n').split(',')
             print(f"CSV表头: {header}")
 
-            with open(txt_file, 'w', encoding='utf-8') as txtfile:
-                for row in reader:
-                    if row and len(row) > 0:
-                        word = row[0]  # 第一列是单词
-                        if word:  # 确保单词不为空
-                            txtfile.write(f"{word}\n")
-                            word_count += 1
+            # 使用1MB的写缓冲区，减少写入的系统调用次数
+            with open(txt_file, 'wb', buffering=1 << 20) as txtfile:
+                for line in csvfile:
+                    word = line.split(b',', 1)[0].rstrip(b'\r\n')  # 第一列是单词
+                    if word:  # 确保单词不为空
+                        txtfile.write(word)
+                        txtfile.write(b'\n')
+                        word_count += 1
 
         print(f"转换完成！")
         print(f"共提取单词: {word_count} 个")
@@ -299,7 +366,7 @@ if __name__ == "__main__":
    - 解析命令行参数（输入目录路径、输出CSV文件名）
 
 2. 文件扫描阶段
-   - 使用os.walk递归遍历指定目录
+   - 使用os.scandir递归遍历指定目录，先收集所有待处理文件
    - 自动过滤常见忽略目录：.git, .idea, .vscode, node_modules, target, build等
    - 根据文件扩展名筛选目标文件，支持多种语言类型：
      * 后端语言：.java, .py, .c, .cpp, .cs, .go, .rs, .php, .rb
@@ -309,16 +376,18 @@ if __name__ == "__main__":
      * 文档文件：.md, .txt, .rst
 
 3. 文件处理阶段
-   - 逐个文件读取内容（UTF-8编码，忽略读取错误）
-   - 按行处理文件内容，跳过空行
+   - 使用进程池（ProcessPoolExecutor）并行处理文件，每个工作进程返回单个文件的单词计数
+   - 逐行读取文件内容（UTF-8编码，忽略读取错误），边读取边统计，不把整个文件读入内存
+   - 跳过空行
    - 使用正则表达式提取包含字母的候选单词：r'[a-zA-Z][a-zA-Z0-9_$-]*'
 
 4. 单词提取与分割阶段
    - 数字过滤：排除包含数字的候选词（保留纯字母单词）
-   - 分隔符处理：按$、_、-符号分割复合词
-   - 驼峰命名分割：使用正则表达式r'([a-z])([A-Z])'在大写字母前插入空格
-   - 连续大写处理：处理XMLParser等格式的专有名词
-   - 最终验证：确保每个提取的单词都匹配r'^[a-zA-Z]+$'模式
+   - 子词分割：使用单个正则表达式r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+'一次匹配出所有子词
+     * 分隔符处理：$、_、-符号不属于任何子词，自然成为分隔
+     * 驼峰命名分割：getValue -> get, Value
+     * 连续大写处理：处理XMLParser等格式的专有名词
+     * 子词只会由ASCII字母组成，无需再单独验证
    - 统一转换为小写形式
 
 5. 统计汇总阶段